@@ -14,10 +14,13 @@
 # ==============================================================================
 import tempfile
 
+import tensorflow as tf
+
 import fastestimator as fe
 from fastestimator.architecture.tensorflow import LeNet
 from fastestimator.dataset.data import mnist
-from fastestimator.op.numpyop.univariate import ExpandDims, Minmax
+from fastestimator.op.numpyop.univariate import ExpandDims
+from fastestimator.op.tensorop import LambdaOp
 from fastestimator.op.tensorop.loss import CrossEntropy
 from fastestimator.op.tensorop.model import ModelOp, UpdateOp
 from fastestimator.schedule import cosine_decay
@@ -38,11 +41,13 @@ def get_estimator(epochs=2,
                            eval_data=eval_data,
                            test_data=test_data,
                            batch_size=batch_size,
-                           ops=[ExpandDims(inputs="x", outputs="x"), Minmax(inputs="x", outputs="x")])
+                           ops=[ExpandDims(inputs="x", outputs="x")])
 
     # step 2
     model = fe.build(model_fn=LeNet, optimizer_fn="adam")
     network = fe.Network(ops=[
+        # normalize on device so that images are transferred as uint8
+        LambdaOp(fn=lambda x: tf.cast(x, tf.float32) / 255.0, inputs="x", outputs="x"),
         ModelOp(model=model, inputs="x", outputs="y_pred"),
         CrossEntropy(inputs=("y_pred", "y"), outputs="ce"),
         UpdateOp(model=model, loss_name="ce")
@@ -17,6 +17,7 @@ from typing import TypeVar
 import tensorflow as tf
 import torch
 
+from fastestimator.backend.cast import cast
 from fastestimator.backend.reduce_mean import reduce_mean
 
 Tensor = TypeVar('Tensor', tf.Tensor, torch.Tensor)
@@ -45,7 +46,9 @@ def binary_crossentropy(y_pred: Tensor, y_true: Tensor, from_logits: bool = Fals
     ```
 
     Args:
-        y_pred: Prediction with a shape like (batch, ...). dtype: float32 or float16.
+        y_pred: Prediction with a shape like (batch, ...). dtype: float32, float16, or bfloat16.
+            Half precision predictions (from mixed precision models) are cast to float32 so the loss is computed in full
+            precision.
         y_true: Ground truth class labels with the same shape as `y_pred`. dtype: int or float32 or float16.
         from_logits: Whether y_pred is from logits. If True, a sigmoid will be applied to the prediction.
         average_loss: Whether to average the element-wise loss.
@@ -60,6 +63,8 @@ def binary_crossentropy(y_pred: Tensor, y_true: Tensor, from_logits: bool = Fals
     assert type(y_pred) is type(y_true), "y_pred and y_true must be same tensor type"
     assert isinstance(y_pred, torch.Tensor) or tf.is_tensor(y_pred), "only support tf.Tensor or torch.Tensor as y_pred"
     assert isinstance(y_true, torch.Tensor) or tf.is_tensor(y_true), "only support tf.Tensor or torch.Tensor as y_true"
+    if y_pred.dtype in (tf.float16, tf.bfloat16, torch.float16, torch.bfloat16):
+        y_pred = cast(y_pred, "float32")
     if tf.is_tensor(y_pred):
         ce = tf.losses.binary_crossentropy(y_pred=y_pred,
                                            y_true=tf.reshape(y_true, y_pred.shape),
@@ -69,9 +74,13 @@ def binary_crossentropy(y_pred: Tensor, y_true: Tensor, from_logits: bool = Fals
     else:
         y_true = y_true.to(torch.float)
         if from_logits:
-            ce = torch.nn.BCEWithLogitsLoss(reduction="none")(input=y_pred, target=y_true.view(y_pred.size()))
+            ce = torch.nn.functional.binary_cross_entropy_with_logits(input=y_pred,
+                                                                    target=y_true.view(y_pred.size()),
+                                                                    reduction="none")
         else:
-            ce = torch.nn.BCELoss(reduction="none")(input=y_pred, target=y_true.view(y_pred.size()))
+            ce = torch.nn.functional.binary_cross_entropy(input=y_pred,
+                                                         target=y_true.view(y_pred.size()),
+                                                         reduction="none")
         ce = ce.view(ce.shape[0], -1)
         ce = torch.mean(ce, dim=1)
 
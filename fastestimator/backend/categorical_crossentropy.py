@@ -17,6 +17,7 @@ from typing import TypeVar
 import tensorflow as tf
 import torch
 
+from fastestimator.backend.cast import cast
 from fastestimator.backend.reduce_mean import reduce_mean
 
 Tensor = TypeVar('Tensor', tf.Tensor, torch.Tensor)
@@ -47,7 +48,9 @@ def categorical_crossentropy(y_pred: Tensor, y_true: Tensor, from_logits: bool =
     ```
 
     Args:
-        y_pred: Prediction with a shape like (Batch, C). dtype: float32 or float16.
+        y_pred: Prediction with a shape like (Batch, C). dtype: float32, float16, or bfloat16.
+            Half precision predictions (from mixed precision models) are cast to float32 so the loss is computed in full
+            precision.
         y_true: Ground truth class labels with a shape like `y_pred`. dtype: int or float32 or float16.
         from_logits: Whether y_pred is from logits. If True, a sigmoid will be applied to the prediction.
         average_loss: Whether to average the element-wise loss.
@@ -62,6 +65,8 @@ def categorical_crossentropy(y_pred: Tensor, y_true: Tensor, from_logits: bool =
     assert type(y_pred) == type(y_true), "y_pred and y_true must be same tensor type"
     assert isinstance(y_pred, (tf.Tensor, torch.Tensor)), "only support tf.Tensor or torch.Tensor as y_pred"
     assert isinstance(y_true, (tf.Tensor, torch.Tensor)), "only support tf.Tensor or torch.Tensor as y_true"
+    if y_pred.dtype in (tf.float16, tf.bfloat16, torch.float16, torch.bfloat16):
+        y_pred = cast(y_pred, "float32")
     if tf.is_tensor(y_pred):
         ce = tf.losses.categorical_crossentropy(y_pred=y_pred, y_true=y_true, from_logits=from_logits)
     else:
@@ -74,7 +79,7 @@ def categorical_crossentropy(y_pred: Tensor, y_true: Tensor, from_logits: bool =
 
 def _categorical_crossentropy_torch(y_pred: Tensor, y_true: Tensor, from_logits: bool) -> Tensor:
     if from_logits:
-        ce = torch.sum(-y_true * torch.nn.LogSoftmax(dim=1)(y_pred), 1)
+        ce = torch.sum(-y_true * torch.log_softmax(y_pred, dim=1), 1)
     else:
         ce = torch.sum(-y_true * torch.log(y_pred), 1)
     return ce
@@ -12,9 +12,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 # ==============================================================================
+import io
 import os
 import pickle
-from typing import Optional, Union
+from typing import Any, Dict, Optional, Set, Union
 
 import tensorflow as tf
 import torch
@@ -65,12 +66,94 @@ def save_model(model: Union[tf.keras.Model, torch.nn.Module],
                 pickle.dump(model.current_optimizer.get_weights(), f)
         return model_path
     elif isinstance(model, torch.nn.Module):
-        model_path = os.path.join(save_dir, "{}.pt".format(model_name))
-        torch.save(model.state_dict(), model_path)
-        if save_optimizer:
-            assert model.current_optimizer, "optimizer does not exist"
-            optimizer_path = os.path.join(save_dir, "{}_opt.pt".format(model_name))
-            torch.save(model.current_optimizer.state_dict(), optimizer_path)
-        return model_path
+        for file_name, state in _get_torch_states({model_name: model}, save_optimizer=save_optimizer).items():
+            torch.save(state, os.path.join(save_dir, file_name))
+        return os.path.join(save_dir, "{}.pt".format(model_name))
     else:
         raise ValueError("Unrecognized model instance {}".format(type(model)))
+
+
+def _get_torch_states(models: Dict[str, torch.nn.Module], save_optimizer: bool = False) -> Dict[str, Any]:
+    """Collect the state dictionaries of PyTorch models, keyed by the names of the files they should be saved into.
+
+    Args:
+        models: A mapping from model names to the models to be saved.
+        save_optimizer: Whether to also collect the optimizer states.
+
+    Returns:
+        A mapping from file names ('<model_name>.pt' and '<model_name>_opt.pt') to state dictionaries.
+    """
+    states = {}
+    for model_name, model in models.items():
+        states["{}.pt".format(model_name)] = model.state_dict()
+        if save_optimizer:
+            assert model.current_optimizer, "optimizer does not exist"
+            states["{}_opt.pt".format(model_name)] = model.current_optimizer.state_dict()
+    return states
+
+
+def _serialize_torch_models(models: Dict[str, torch.nn.Module],
+                            staging_buffers: Dict[str, torch.Tensor],
+                            save_optimizer: bool = False) -> Dict[str, memoryview]:
+    """Serialize the weights (and optionally optimizer states) of PyTorch models into the contents of their save files.
+
+    Every GPU tensor is first copied into a pinned host buffer using a non-blocking transfer, followed by a single
+    synchronization of each source device, rather than blocking on each tensor individually. The buffers are stored in
+    (and re-used from) `staging_buffers` so that repeated saves do not need to allocate new pinned memory.
+
+    Args:
+        models: A mapping from model names to the models to be serialized.
+        staging_buffers: A cache of pinned host buffers to stage GPU tensors through.
+        save_optimizer: Whether to also serialize the optimizer states.
+
+    Returns:
+        A mapping from file names ('<model_name>.pt' and '<model_name>_opt.pt') to their serialized contents.
+    """
+    devices = set()
+    states = {
+        file_name: _stage_tensors(state, file_name, staging_buffers, devices)
+        for file_name, state in _get_torch_states(models, save_optimizer=save_optimizer).items()
+    }
+    for device in devices:
+        torch.cuda.synchronize(device)  # Copies on every source device must land before the buffers are read
+    blobs = {}
+    for file_name, state in states.items():
+        buffer = io.BytesIO()
+        torch.save(state, buffer)
+        blobs[file_name] = buffer.getbuffer()  # A view rather than a second copy of the contents
+    return blobs
+
+
+def _stage_tensors(data: Any, key: str, staging_buffers: Dict[str, torch.Tensor], devices: Set[torch.device]) -> Any:
+    """Recursively copy any GPU tensors within `data` into persistent pinned host buffers.
+
+    Args:
+        data: The data (typically a state dictionary) to be staged.
+        key: A unique identifier for the location of `data`, used to look up its staging buffer.
+        staging_buffers: The cache of pinned host buffers.
+        devices: A set to be updated with every device that a copy was issued from.
+
+    Returns:
+        A copy of `data` in which every GPU tensor has been replaced by its (still in-flight) host buffer.
+    """
+    if isinstance(data, torch.Tensor):
+        if not data.is_cuda:
+            return data
+        buffer = staging_buffers.get(key)
+        if buffer is None or buffer.shape != data.shape or buffer.dtype != data.dtype:
+            buffer = torch.empty(data.shape, dtype=data.dtype, pin_memory=True)
+            staging_buffers[key] = buffer
+        buffer.copy_(data, non_blocking=True)
+        devices.add(data.device)
+        return buffer
+    elif isinstance(data, dict):
+        staged = data.copy()
+        for k, v in data.items():
+            staged[k] = _stage_tensors(v, "{}/{}".format(key, k), staging_buffers, devices)
+        if hasattr(data, '_metadata'):
+            staged._metadata = data._metadata  # Used by torch to handle state dict versioning
+        return staged
+    elif isinstance(data, (list, tuple)):
+        return type(data)(
+            _stage_tensors(elem, "{}/{}".format(key, idx), staging_buffers, devices) for idx, elem in enumerate(data))
+    return data
@@ -17,6 +17,7 @@ from typing import TypeVar
 import tensorflow as tf
 import torch
 
+from fastestimator.backend.cast import cast
 from fastestimator.backend.reduce_mean import reduce_mean
 
 Tensor = TypeVar('Tensor', tf.Tensor, torch.Tensor)
@@ -49,7 +50,9 @@ def sparse_categorical_crossentropy(y_pred: Tensor,
     ```
 
     Args:
-        y_pred: Prediction with a shape like (Batch, C). dtype: float32 or float16.
+        y_pred: Prediction with a shape like (Batch, C). dtype: float32, float16, or bfloat16.
+            Half precision predictions (from mixed precision models) are cast to float32 so the loss is computed in full
+            precision.
         y_true: Ground truth class labels with a shape like (Batch) or (Batch, 1). dtype: int.
         from_logits: Whether y_pred is from logits. If True, a softmax will be applied to the prediction.
         average_loss: Whether to average the element-wise loss.
@@ -64,14 +67,16 @@ def sparse_categorical_crossentropy(y_pred: Tensor,
     assert type(y_pred) == type(y_true), "y_pred and y_true must be same tensor type"
     assert isinstance(y_pred, (tf.Tensor, torch.Tensor)), "only support tf.Tensor or torch.Tensor as y_pred"
     assert isinstance(y_true, (tf.Tensor, torch.Tensor)), "only support tf.Tensor or torch.Tensor as y_true"
+    if y_pred.dtype in (tf.float16, tf.bfloat16, torch.float16, torch.bfloat16):
+        y_pred = cast(y_pred, "float32")
     if tf.is_tensor(y_pred):
         ce = tf.losses.sparse_categorical_crossentropy(y_pred=y_pred, y_true=y_true, from_logits=from_logits)
     else:
         y_true = y_true.view(-1)
         if from_logits:
-            ce = torch.nn.CrossEntropyLoss(reduction="none")(input=y_pred, target=y_true.long())
+            ce = torch.nn.functional.cross_entropy(input=y_pred, target=y_true.long(), reduction="none")
         else:
-            ce = torch.nn.NLLLoss(reduction="none")(input=torch.log(y_pred), target=y_true.long())
+            ce = torch.nn.functional.nll_loss(input=torch.log(y_pred), target=y_true.long(), reduction="none")
     if average_loss:
         ce = reduce_mean(ce)
     return ce
@@ -242,20 +242,23 @@ class Estimator:
         """
         all_traces = sort_traces(get_current_items(self.traces_in_use, run_modes=run_modes))
         try:
-            self._run_traces_on_begin(traces=all_traces)
-            if "train" in run_modes or "eval" in run_modes:
-                for self.system.epoch_idx in range(self.system.epoch_idx + 1, self.system.total_epochs + 1):
-                    if "train" in self.pipeline.get_modes(epoch=self.system.epoch_idx):
-                        self.system.mode = "train"
-                        self._run_epoch()
-                    if "eval" in self.pipeline.get_modes(epoch=self.system.epoch_idx):
-                        self.system.mode = "eval"
-                        self._run_epoch()
-            else:
-                self._run_epoch()
-        except EarlyStop:
-            pass  # On early stopping we still want to run the final traces and return results
-        self._run_traces_on_end(traces=all_traces)
+            try:
+                self._run_traces_on_begin(traces=all_traces)
+                if "train" in run_modes or "eval" in run_modes:
+                    for self.system.epoch_idx in range(self.system.epoch_idx + 1, self.system.total_epochs + 1):
+                        if "train" in self.pipeline.get_modes(epoch=self.system.epoch_idx):
+                            self.system.mode = "train"
+                            self._run_epoch()
+                        if "eval" in self.pipeline.get_modes(epoch=self.system.epoch_idx):
+                            self.system.mode = "eval"
+                            self._run_epoch()
+                else:
+                    self._run_epoch()
+            except EarlyStop:
+                pass  # On early stopping we still want to run the final traces and return results
+            self._run_traces_on_end(traces=all_traces)
+        finally:
+            self.system.finalize()  # Make sure any background checkpoint has been flushed to disk
 
     def _run_epoch(self) -> None:
         """A method to perform an epoch of activity.
@@ -318,7 +321,7 @@ class Estimator:
             data_type = to_type(batch)
             data_shape = to_shape(batch, add_batch=add_batch, exact_shape=False)
             new_loader = tf.data.Dataset.from_generator(lambda: loader, data_type, output_shapes=data_shape)
-            new_loader = new_loader.prefetch(1)
+            new_loader = new_loader.prefetch(tf.data.experimental.AUTOTUNE)
         if isinstance(new_loader, tf.data.Dataset):
             if self.system.max_train_steps_per_epoch and self.system.mode == "train":
                 new_loader = new_loader.take(self.system.max_train_steps_per_epoch)
@@ -12,16 +12,17 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 # ==============================================================================
-from typing import Iterable, Tuple, Union
+from typing import Any, Dict, Iterable, List, Tuple, Union
 
-from albumentations.augmentations.transforms import MedianBlur as MedianBlurAlb
+import cv2
+import numpy as np
 
-from fastestimator.op.numpyop.univariate.univariate import ImageOnlyAlbumentation
+from fastestimator.op.numpyop.numpyop import NumpyOp
 from fastestimator.util.traceability_util import traceable
 
 
 @traceable()
-class MedianBlur(ImageOnlyAlbumentation):
+class MedianBlur(NumpyOp):
     """Blur the image with median filter of random aperture size.
 
     Args:
@@ -35,13 +36,47 @@ class MedianBlur(ImageOnlyAlbumentation):
 
     Image types:
         uint8, float32
+
+    Raises:
+        ValueError: If `blur_limit` does not contain any odd aperture sizes of at least 3.
     """
     def __init__(self,
                  inputs: Union[str, Iterable[str]],
                  outputs: Union[str, Iterable[str]],
                  mode: Union[None, str, Iterable[str]] = None,
                  blur_limit: Union[int, Tuple[int, int]] = 5):
-        super().__init__(MedianBlurAlb(blur_limit=blur_limit, always_apply=True),
-                         inputs=inputs,
-                         outputs=outputs,
-                         mode=mode)
+        super().__init__(inputs=inputs, outputs=outputs, mode=mode)
+        assert len(self.inputs) == len(self.outputs), "Input and Output lengths must match"
+        self.in_list, self.out_list = True, True
+        low, high = (3, blur_limit) if isinstance(blur_limit, int) else blur_limit
+        self.ksizes = [ksize for ksize in range(max(low, 3), high + 1) if ksize % 2 == 1]
+        if not self.ksizes:
+            raise ValueError("blur_limit must allow at least one odd aperture size >= 3, but got {}".format(blur_limit))
+
+    def forward(self, data: List[np.ndarray], state: Dict[str, Any]) -> List[np.ndarray]:
+        # The same aperture is used for every input so that paired images stay consistent
+        ksize = int(np.random.choice(self.ksizes))
+        return [self._median_blur(elem, ksize) for elem in data]
+
+    @staticmethod
+    def _median_blur(data: np.ndarray, ksize: int) -> np.ndarray:
+        """Apply a median filter to a single image.
+
+        Args:
+            data: The image to be blurred.
+            ksize: The (odd) aperture size of the filter.
+
+        Returns:
+            The blurred image, with the same shape as `data`.
+
+        Raises:
+            ValueError: If a float32 image is paired with an aperture size other than 3 or 5.
+        """
+        if ksize not in (3, 5) and data.dtype == np.float32:
+            raise ValueError("Invalid ksize value {}. For float32 images only valid ksize values are 3 and 5".format(
+                ksize))
+        if data.ndim == 3 and data.shape[-1] not in (1, 3, 4):
+            # OpenCV only supports 1, 3, or 4 channel images, so filter each channel independently
+            return np.stack([cv2.medianBlur(np.ascontiguousarray(data[..., c]), ksize) for c in range(data.shape[-1])],
+                            axis=-1)
+        return cv2.medianBlur(data, ksize).reshape(data.shape)
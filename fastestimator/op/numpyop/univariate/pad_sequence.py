@@ -46,26 +46,35 @@ class PadSequence(NumpyOp):
         self.max_len = max_len
         self.value = value
         self.append = append
+        self._value = np.asarray(value)  # Resolved once here rather than on every call
 
     def forward(self, data: List[np.ndarray], state: Dict[str, Any]) -> List[np.ndarray]:
+        """Pad the input sequences to the maximum length. Sequences longer than `max_len` are truncated.
+
+        Each sequence is copied into a single preallocated buffer of its own dtype, rather than being concatenated with
+        a separately allocated padding array.
+
+        Args:
+            data: Input sequences in the data.
+            state: Information about the current execution context.
+
+        Returns:
+            Padded sequences.
+        """
         return [self._pad_sequence(elem) for elem in data]
 
-    def _pad_sequence(self, data: np.ndarray) -> np.ndarray:
+    def _pad_sequence(self, data: Union[np.ndarray, List[Any]]) -> np.ndarray:
         """Pad the input sequence to the maximum length. Sequences longer than `max_len` are truncated.
 
         Args:
-            data: input sequence in the data.
+            data: Input sequence in the data.
 
         Returns:
-            Padded sequence
+            Padded sequence.
         """
-        if len(data) < self.max_len:
-            pad_len = self.max_len - len(data)
-            pad_arr = np.full(pad_len, self.value)
-            if self.append:
-                data = np.append(data, pad_arr)
-            else:
-                data = np.append(pad_arr, data)
-        else:
-            data = data[:self.max_len]
-        return data
+        data = np.asarray(data)
+        padded = np.full(self.max_len, self._value, dtype=np.result_type(data, self._value))
+        length = min(len(data), self.max_len)
+        start = 0 if self.append else self.max_len - length
+        padded[start:start + length] = data[:length]
+        return padded
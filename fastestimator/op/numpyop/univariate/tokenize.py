@@ -49,7 +49,7 @@ class Tokenize(NumpyOp):
         return [self._apply_tokenization(seq) for seq in data]
 
     def _apply_tokenization(self, data: str) -> List[str]:
-        """Split the sequence into tokens and apply lowercase if `do_lower_case` is set.
+        """Split the sequence into tokens and apply lowercase if `to_lower_case` is set.
 
         Args:
             data: Input sequence.
@@ -59,8 +59,11 @@ class Tokenize(NumpyOp):
         """
         if self.tokenize_fn:
             data = self.tokenize_fn(data)
+            if self.to_lower_case:
+                data = [token.lower() for token in data]
         else:
+            # Lowercasing the whole sequence before splitting avoids a call per token
+            if self.to_lower_case:
+                data = data.lower()
             data = data.split()
-        if self.to_lower_case:
-            data = list(map(lambda x: x.lower(), data))
         return data
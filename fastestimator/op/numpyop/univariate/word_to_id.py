@@ -63,5 +63,5 @@ class WordtoId(NumpyOp):
         if callable(self.mapping):
             data = self.mapping(data)
         else:
-            data = [self.mapping.get(token) for token in data]
+            data = list(map(self.mapping.get, data))
         return np.array(data)
@@ -60,7 +60,10 @@ class MixUpBatch(TensorOp):
         if framework == 'tf':
             self.beta = tfp.distributions.Beta(self.alpha, self.alpha)
         elif framework == 'torch':
-            self.beta = torch.distributions.beta.Beta(self.alpha, self.alpha)
+            # Place the distribution on the same device as the Network so that lambda is sampled on the accelerator
+            device = torch.device("cuda:0" if torch.cuda.is_available() else "cpu")
+            alpha = torch.tensor(self.alpha, dtype=torch.float32, device=device)
+            self.beta = torch.distributions.beta.Beta(alpha, alpha)
         else:
             raise ValueError("unrecognized framework: {}".format(framework))
 
@@ -57,8 +57,16 @@ class CrossEntropy(LossOp):
             "sparse": sparse_categorical_crossentropy
         }
 
-    def forward(self, data: List[Tensor], state: Dict[str, Any]) -> Tensor:
-        y_pred, y_true = data
+    def get_form(self, y_pred: Tensor, y_true: Tensor) -> str:
+        """Determine which form of cross entropy should be applied to the given tensors.
+
+        Args:
+            y_pred: The predicted values.
+            y_true: The ground truth values.
+
+        Returns:
+            The user-specified `form`, or one inferred from the tensor shapes if `form` is None.
+        """
         form = self.form
         if form is None:
             if len(y_pred.shape) == 2 and y_pred.shape[-1] > 1:
@@ -68,5 +76,10 @@ class CrossEntropy(LossOp):
                     form = "sparse"
             else:
                 form = "binary"
+        return form
+
+    def forward(self, data: List[Tensor], state: Dict[str, Any]) -> Tensor:
+        y_pred, y_true = data
+        form = self.get_form(y_pred, y_true)
         loss = self.cross_entropy_fn[form](y_pred, y_true, from_logits=self.from_logits, average_loss=self.average_loss)
         return loss
@@ -12,13 +12,15 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 # ==============================================================================
-from typing import Any, Dict, List, TypeVar
+from typing import Any, Dict, List, TypeVar, Union
 
 import tensorflow as tf
 import torch
 
 import fastestimator as fe
+from fastestimator.backend.cast import cast
 from fastestimator.backend.roll import roll
+from fastestimator.op.tensorop.loss.cross_entropy import CrossEntropy
 from fastestimator.op.tensorop.loss.loss import LossOp
 
 Tensor = TypeVar('Tensor', tf.Tensor, torch.Tensor)
@@ -58,14 +60,69 @@ class MixLoss(LossOp):
 
     def forward(self, data: List[Tensor], state: Dict[str, Any]) -> Tensor:
         lam, *args = data
-        loss1 = self.loss.forward(args, state)
+        if self._is_fusable(lam, args):
+            loss = self._mixed_sparse_cross_entropy(lam, args)
+        else:
+            loss1 = self.loss.forward(args, state)
 
-        args[self.loss.true_key_idx] = roll(args[self.loss.true_key_idx], shift=1, axis=0)
-        loss2 = self.loss.forward(args, state)
+            args[self.loss.true_key_idx] = roll(args[self.loss.true_key_idx], shift=1, axis=0)
+            loss2 = self.loss.forward(args, state)
 
-        loss = lam * loss1 + (1.0 - lam) * loss2
+            loss = lam * loss1 + (1.0 - lam) * loss2
 
         if self.average_loss:
             loss = fe.backend.reduce_mean(loss)
 
         return loss
+
+    def _is_fusable(self, lam: Union[float, Tensor], args: List[Tensor]) -> bool:
+        """Whether the mixed loss can be computed with `_mixed_sparse_cross_entropy`.
+
+        Subclasses of CrossEntropy may override `forward`, so only the base class is eligible. Higher rank predictions
+        (ex. (Batch, Time, C) with an explicit form="sparse") are left to the regular path.
+
+        Args:
+            lam: The mixing coefficient.
+            args: The inputs for the wrapped loss op.
+
+        Returns:
+            True iff the wrapped loss is a plain sparse CrossEntropy on (Batch, C) predictions and `lam` is a scalar.
+        """
+        if type(self.loss) is not CrossEntropy or len(getattr(lam, "shape", ())) != 0:
+            return False
+        y_pred, y_true = args[self.loss.pred_key_idx], args[self.loss.true_key_idx]
+        return len(y_pred.shape) == 2 and self.loss.get_form(y_pred, y_true) == "sparse"
+
+    def _mixed_sparse_cross_entropy(self, lam: Union[float, Tensor], args: List[Tensor]) -> Tensor:
+        """Compute a mixed sparse cross entropy loss using a single pass over the predictions.
+
+        The log-probabilities are computed once and then gathered at both the original and the rolled class labels,
+        rather than evaluating the underlying loss twice.
+
+        Args:
+            lam: A scalar mixing coefficient.
+            args: The inputs for the wrapped CrossEntropy op.
+
+        Returns:
+            The element-wise mixed cross entropy.
+        """
+        y_pred, y_true = args[self.loss.pred_key_idx], args[self.loss.true_key_idx]
+        if y_pred.dtype in (tf.float16, tf.bfloat16, torch.float16, torch.bfloat16):
+            y_pred = cast(y_pred, "float32")
+        if tf.is_tensor(y_pred):
+            if self.loss.from_logits:
+                logits = y_pred
+            else:
+                # Mirror tf.keras, which clips the probabilities before taking their log
+                epsilon = tf.keras.backend.epsilon()
+                logits = tf.math.log(tf.clip_by_value(y_pred, epsilon, 1.0 - epsilon))
+            log_prob = tf.nn.log_softmax(logits)
+            idx = tf.reshape(cast(y_true, "int32"), [-1])
+            log_prob1 = tf.gather(log_prob, idx, batch_dims=1)
+            log_prob2 = tf.gather(log_prob, roll(idx, shift=1, axis=0), batch_dims=1)
+        else:
+            log_prob = torch.log_softmax(y_pred, dim=-1) if self.loss.from_logits else torch.log(y_pred)
+            idx = y_true.view(-1, 1).long()
+            log_prob1 = log_prob.gather(1, idx).squeeze(1)
+            log_prob2 = log_prob.gather(1, roll(idx, shift=1, axis=0)).squeeze(1)
+        return -(lam * log_prob1 + (1.0 - lam) * log_prob2)
@@ -14,20 +14,22 @@
 # ==============================================================================
 import datetime
 import json
+import mmap
 import os
 import pickle
-from typing import Any, Dict, List, Optional, TYPE_CHECKING, TypeVar, Union
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, TYPE_CHECKING, Tuple, TypeVar, Union
 
 import tensorflow as tf
 import torch
 
 from fastestimator.backend.load_model import load_model
-from fastestimator.backend.save_model import save_model
+from fastestimator.backend.save_model import _serialize_torch_models, save_model
 from fastestimator.network import BaseNetwork
 from fastestimator.pipeline import Pipeline
 from fastestimator.schedule.schedule import Scheduler
 from fastestimator.summary.summary import Summary
-from fastestimator.util.traceability_util import FeSummaryTable, is_restorable
+from fastestimator.util.traceability_util import FeSummaryTable
 
 if TYPE_CHECKING:
     from fastestimator.trace.trace import Trace
@@ -86,6 +88,19 @@ class System:
     summary: Summary
     experiment_time: str
 
+    # The simple attributes which make up the high-level training state
+    _RESTORABLE_FIELDS = ('mode',
+                          'global_step',
+                          'num_devices',
+                          'log_steps',
+                          'total_epochs',
+                          'epoch_idx',
+                          'batch_idx',
+                          'stop_training',
+                          'max_train_steps_per_epoch',
+                          'max_eval_steps_per_epoch',
+                          'experiment_time')
+
     def __init__(self,
                  network: BaseNetwork,
                  pipeline: Pipeline,
@@ -111,6 +126,11 @@ class System:
         self.stop_training = False
         self.summary = Summary(None, system_config)
         self.experiment_time = ""
+        self._save_executor = ThreadPoolExecutor(max_workers=1)
+        self._pending_save: Optional[Future] = None
+        self._staging_buffers: Dict[str, torch.Tensor] = {}
+        self._getstate_mask: Optional[Dict[str, List[bool]]] = None
+        self._history_cache: Dict[Tuple[Optional[str], str], Dict[int, Any]] = {}
         self._initialize_state()
 
     def _initialize_state(self) -> None:
@@ -148,6 +168,9 @@ class System:
         self.batch_idx = None
         self.stop_training = False
         self.summary = Summary(summary_name, system_config)
+        # The save plan may differ for the new run
+        self._getstate_mask = None
+        self._history_cache = {}
 
     def reset_for_test(self, summary_name: Optional[str] = None) -> None:
         """Partially reset the current `System` object for a new round of testing.
@@ -162,6 +185,7 @@ class System:
         self.stop_training = False
         self.summary.name = summary_name or self.summary.name  # Keep old experiment name if new one not provided
         self.summary.history.pop('test', None)
+        self._history_cache = {}
 
     def write_summary(self, key: str, value: Any) -> None:
         """Write an entry into the `Summary` object (iff the experiment was named).
@@ -171,43 +195,162 @@ class System:
             value: The value to write into the summary object.
         """
         if self.summary:
-            self.summary.history[self.mode][key][self.global_step or 0] = value
+            cache_key = (self.mode, key)
+            entries = self._history_cache.get(cache_key)
+            if entries is None:
+                entries = self.summary.history[self.mode][key]
+                self._history_cache[cache_key] = entries
+            entries[self.global_step or 0] = value
 
-    def save_state(self, save_dir: str) -> None:
-        """Load training state.
+    def save_state(self, save_dir: str, on_complete: Optional[Callable[[], None]] = None) -> Future:
+        """Save training state.
+
+        The state is snapshotted on the calling thread so that it is consistent, but the resulting bytes are flushed to
+        disk by a background thread so that training does not stall on I/O. TensorFlow model weights are written
+        synchronously since Keras can only save them directly to a file. Any previously pending save is awaited before
+        a new one begins.
 
         Args:
-            save_dir: The directory into which to save the state
+            save_dir: The directory into which to save the state.
+            on_complete: An optional function to be invoked (on the background thread) once every file has been
+                written.
+
+        Returns:
+            A future which will resolve once the state has been fully written to disk.
         """
+        self._wait_for_pending_save()
         os.makedirs(save_dir, exist_ok=True)
-        # Start with the high-level info. We could use pickle for this but having it human readable is nice.
-        state = {key: value for key, value in self.__dict__.items() if is_restorable(value)[0]}
-        with open(os.path.join(save_dir, 'system.json'), 'w') as fp:
-            json.dump(state, fp, indent=4)
-        # Save all of the models / optimizer states
         for model in self.network.models:
-            save_model(model, save_dir=save_dir, save_optimizer=True)
+            if not isinstance(model, torch.nn.Module):
+                save_model(model, save_dir=save_dir, save_optimizer=True)
+        blobs = self._snapshot_for_async()
+        if self._save_executor is None:
+            self._save_executor = ThreadPoolExecutor(max_workers=1)
+        self._pending_save = self._save_executor.submit(self._write_blobs, save_dir, blobs, on_complete)
+        return self._pending_save
+
+    def _snapshot_for_async(self) -> Dict[str, Union[bytes, memoryview]]:
+        """Serialize the training state (other than TensorFlow models) into bytes.
+
+        The training loop is free to keep mutating the models, ops, and summary as soon as this method returns, so
+        everything handed to the background writer must be fully serialized here rather than referenced.
+
+        Returns:
+            A mapping from file names to their serialized contents.
+        """
+        # Start with the high-level info. We could use pickle for this but having it human readable is nice.
+        state = {key: getattr(self, key) for key in self._RESTORABLE_FIELDS}
+        blobs = {'system.json': json.dumps(state, indent=4).encode('utf-8')}
+        # Save the PyTorch models / optimizer states, staged through pinned host memory
+        torch_models = {
+            model.model_name: model
+            for model in self.network.models if isinstance(model, torch.nn.Module)
+        }
+        blobs.update(_serialize_torch_models(torch_models, self._staging_buffers, save_optimizer=True))
         # Save the Summary object
-        with open(os.path.join(save_dir, 'summary.pkl'), 'wb') as file:
-            pickle.dump(self.summary, file)
-        # Save the Traces
-        with open(os.path.join(save_dir, 'traces.pkl'), 'wb') as file:
-            pickle.dump([trace.__getstate__() if hasattr(trace, '__getstate__') else {} for trace in self.traces], file)
-        # Save the TensorOps
-        with open(os.path.join(save_dir, 'tops.pkl'), 'wb') as file:
-            pickle.dump([op.__getstate__() if hasattr(op, '__getstate__') else {} for op in self.network.ops], file)
-        # Save the NumpyOps
-        with open(os.path.join(save_dir, 'nops.pkl'), 'wb') as file:
-            pickle.dump([op.__getstate__() if hasattr(op, '__getstate__') else {} for op in self.pipeline.ops], file)
-        # Save the Datasets
-        with open(os.path.join(save_dir, 'ds.pkl'), 'wb') as file:
-            pickle.dump(
-                {
-                    key: value.__getstate__()
-                    for key,
-                    value in self.pipeline.data.items() if hasattr(value, '__getstate__')
-                },
-                file)
+        blobs['summary.pkl'] = pickle.dumps(self.summary, protocol=pickle.HIGHEST_PROTOCOL)
+        # Save the Traces, TensorOps, NumpyOps, and Datasets together in a single file
+        collections = {}
+        collections['traces'] = [
+            trace.__getstate__() if has_state else {}
+            for trace, has_state in zip(self.traces, self._get_getstate_mask('traces', self.traces))
+        ]
+        collections['tops'] = [
+            op.__getstate__() if has_state else {}
+            for op, has_state in zip(self.network.ops, self._get_getstate_mask('tops', self.network.ops))
+        ]
+        collections['nops'] = [
+            op.__getstate__() if has_state else {}
+            for op, has_state in zip(self.pipeline.ops, self._get_getstate_mask('nops', self.pipeline.ops))
+        ]
+        datasets = list(self.pipeline.data.items())
+        collections['ds'] = {
+            key: value.__getstate__()
+            for (key, value), has_state in zip(datasets, self._get_getstate_mask('ds', [ds for _, ds in datasets]))
+            if has_state
+        }
+        blobs['state_collections.pkl'] = pickle.dumps(collections, protocol=pickle.HIGHEST_PROTOCOL)
+        return blobs
+
+    def _get_getstate_mask(self, name: str, objects: List[Any]) -> List[bool]:
+        """Determine which of a list of objects have a `__getstate__` method.
+
+        The result is computed on the first call for a given collection, and then re-used until the next `reset()` (or
+        until the number of objects changes).
+
+        Args:
+            name: A unique name for the collection of `objects`.
+            objects: The objects to be inspected.
+
+        Returns:
+            Whether each of the `objects` has a `__getstate__` method.
+        """
+        if self._getstate_mask is None:
+            self._getstate_mask = {}
+        mask = self._getstate_mask.get(name)
+        if mask is None or len(mask) != len(objects):
+            mask = [hasattr(obj, '__getstate__') for obj in objects]
+            self._getstate_mask[name] = mask
+        return mask
+
+    def _write_blobs(self,
+                     save_dir: str,
+                     blobs: Dict[str, Union[bytes, memoryview]],
+                     on_complete: Optional[Callable[[], None]]) -> None:
+        """Write pre-serialized state files to disk.
+
+        The files are independent of one another, so they are written concurrently in order to keep the disk busy.
+
+        Args:
+            save_dir: The directory into which to write the files.
+            blobs: A mapping from file names to their serialized contents.
+            on_complete: An optional function to be invoked once every file has been written.
+        """
+        with ThreadPoolExecutor(max_workers=min(8, len(blobs)) or 1) as executor:
+            futures = [
+                executor.submit(self._write_blob, save_dir, file_name, blob)
+                for file_name, blob in blobs.items()
+            ]
+            for future in futures:
+                future.result()  # Re-raise any errors which were encountered while writing
+        if on_complete is not None:
+            on_complete()
+
+    @staticmethod
+    def _write_blob(save_dir: str, file_name: str, blob: Union[bytes, memoryview]) -> None:
+        """Write a single pre-serialized state file to disk.
+
+        Args:
+            save_dir: The directory into which to write the file.
+            file_name: The name of the file to be written.
+            blob: The serialized contents of the file.
+        """
+        with open(os.path.join(save_dir, file_name), 'wb') as file:
+            file.write(blob)
+
+    def _wait_for_pending_save(self) -> None:
+        """Block until the most recent `save_state` call has finished writing to disk.
+
+        Raises:
+            Exception: Any error which was encountered while writing the state files.
+        """
+        pending, self._pending_save = self._pending_save, None
+        if pending is not None:
+            pending.result()
+
+    def finalize(self) -> None:
+        """Finish any outstanding background saves and release the writer thread.
+
+        The pinned host buffers used to stage PyTorch checkpoints are also released. The `System` remains usable
+        afterwards; a new writer thread will be started by the next `save_state` call.
+        """
+        try:
+            self._wait_for_pending_save()
+        finally:
+            self._staging_buffers.clear()  # Release the pinned host memory
+            if self._save_executor is not None:
+                self._save_executor.shutdown(wait=True)
+                self._save_executor = None
 
     def load_state(self, load_dir: str) -> None:
         """Load training state.
@@ -218,30 +361,107 @@ class System:
         Raises:
             FileNotFoundError: If necessary files can not be found.
         """
+        self._wait_for_pending_save()
+        self._prefetch(load_dir)
         # Reload the high-level system information
         system_path = os.path.join(load_dir, 'system.json')
-        if not os.path.exists(system_path):
-            raise FileNotFoundError(f"Could not find system summary file at {system_path}")
-        with open(system_path, 'r') as fp:
-            state = json.load(fp)
-        self.__dict__.update(state)
-        # Reload the models
-        for model in self.network.models:
-            self._load_model(model, load_dir)
-        # Reload the Summary
+        try:
+            with open(system_path, 'r') as fp:
+                state = json.load(fp)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Could not find system summary file at {system_path}") from None
+        for key in self._RESTORABLE_FIELDS:
+            if key in state:
+                setattr(self, key, state[key])
+        self._history_cache = {}  # The summary history is about to be replaced
+        # Everything else lives in independent files, so those can be read concurrently
         summary_path = os.path.join(load_dir, 'summary.pkl')
-        if not os.path.exists(summary_path):
-            raise FileNotFoundError(f"Could not find summary file at {summary_path}")
-        with open(summary_path, 'rb') as file:
-            self.summary.__dict__.update(pickle.load(file).__dict__)
-        # Reload the Traces
-        self._load_list(os.path.join(load_dir, 'traces.pkl'), self.traces)
-        # Reload the TensorOps
-        self._load_list(os.path.join(load_dir, 'tops.pkl'), self.network.ops)
-        # Reload the NumpyOps
-        self._load_list(os.path.join(load_dir, 'nops.pkl'), self.pipeline.ops)
-        # Reload the Datasets
-        self._load_dict(os.path.join(load_dir, 'ds.pkl'), self.pipeline.data)
+        num_tasks = len(self.network.models) + 2
+        with ThreadPoolExecutor(max_workers=min(num_tasks, os.cpu_count() or 1)) as executor:
+            # Reload the models
+            futures = [executor.submit(self._load_model, model, load_dir) for model in self.network.models]
+            # Reload the Summary
+            futures.append(executor.submit(self._load_summary, summary_path, self.summary))
+            # Reload the Traces, TensorOps, NumpyOps, and Datasets
+            futures.append(executor.submit(self._load_collections, load_dir))
+            for future in futures:
+                future.result()  # Re-raise any errors which were encountered while loading
+
+    def _load_collections(self, load_dir: str) -> None:
+        """Load the states of the traces, ops, and datasets from the disk.
+
+        Checkpoints written by older versions of FastEstimator stored each collection in its own file, so those are
+        used as a fallback if the combined file is not present.
+
+        Args:
+            load_dir: The directory from which to reload the states.
+
+        Raises:
+            ValueError: If the saved states do not match the in-memory objects.
+            FileNotFoundError: If the state files cannot be found.
+        """
+        state_path = os.path.join(load_dir, 'state_collections.pkl')
+        try:
+            states = self._load_pickle(state_path)
+        except FileNotFoundError:
+            self._load_list(os.path.join(load_dir, 'traces.pkl'), self.traces)
+            self._load_list(os.path.join(load_dir, 'tops.pkl'), self.network.ops)
+            self._load_list(os.path.join(load_dir, 'nops.pkl'), self.pipeline.ops)
+            self._load_dict(os.path.join(load_dir, 'ds.pkl'), self.pipeline.data)
+            return
+        if not isinstance(states, dict) or not {'traces', 'tops', 'nops', 'ds'} <= states.keys():
+            raise ValueError(f"Expected {state_path} to contain a dict of traces, tops, nops, and ds states")
+        self._restore_list(states['traces'], self.traces, f"{state_path}['traces']")
+        self._restore_list(states['tops'], self.network.ops, f"{state_path}['tops']")
+        self._restore_list(states['nops'], self.pipeline.ops, f"{state_path}['nops']")
+        self._restore_dict(states['ds'], self.pipeline.data, f"{state_path}['ds']")
+
+    @staticmethod
+    def _prefetch(load_dir: str) -> None:
+        """Ask the OS to start reading the checkpoint files into the page cache.
+
+        This lets the disk readahead overlap with the Python-level work of parsing and restoring the state. It is a
+        no-op on platforms without `posix_fadvise` (ex. Windows).
+
+        Args:
+            load_dir: The directory from which the state will be loaded.
+        """
+        if not hasattr(os, 'posix_fadvise'):
+            return
+        try:
+            entries = list(os.scandir(load_dir))
+        except OSError:
+            return  # Missing directories will be reported when the files are actually loaded
+        for entry in entries:
+            if not entry.is_file():
+                continue
+            try:
+                fd = os.open(entry.path, os.O_RDONLY)
+            except OSError:
+                continue
+            try:
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+            except OSError:
+                pass  # This is only a hint, so file systems which don't support it can be ignored
+            finally:
+                os.close(fd)
+
+    @staticmethod
+    def _load_summary(summary_path: str, summary: Summary) -> None:
+        """Load a pickled summary from the disk.
+
+        Args:
+            summary_path: The path to the pickle file.
+            summary: The existing in memory summary to be updated.
+
+        Raises:
+            FileNotFoundError: If the summary file cannot be found.
+        """
+        try:
+            state = System._load_pickle(summary_path)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Could not find summary file at {summary_path}") from None
+        summary.__dict__.update(state.__dict__)
 
     @staticmethod
     def _load_model(model: Model, base_path: str) -> None:
@@ -269,6 +489,29 @@ class System:
             raise FileNotFoundError(f"Cannot find model optimizer file at {optimizer_path}")
         load_model(model, weights_path=weights_path, load_optimizer=True)
 
+    @staticmethod
+    def _load_pickle(path: str) -> Any:
+        """Unpickle a file by memory-mapping it rather than reading it onto the heap.
+
+        Falls back to a regular read if the file cannot be mapped (ex. it is empty, or the platform / file system does
+        not support mmap).
+
+        Args:
+            path: The path to the pickle file.
+
+        Returns:
+            The unpickled object.
+        """
+        with open(path, 'rb') as file:
+            try:
+                mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            except (ValueError, OSError):
+                return pickle.load(file)
+            with mapped:
+                if hasattr(mapped, 'madvise') and hasattr(mmap, 'MADV_SEQUENTIAL'):
+                    mapped.madvise(mmap.MADV_SEQUENTIAL)
+                return pickle.loads(mapped)
+
     @staticmethod
     def _load_list(state_path: str, in_memory_objects: List[Any]) -> None:
         """Load a list of pickled states from the disk.
@@ -281,23 +524,37 @@ class System:
             ValueError: If the number of saved states does not match the number of in-memory objects.
             FileNotFoundError: If the desired state file cannot be found.
         """
-        if not os.path.exists(state_path):
-            raise FileNotFoundError(f"Could not find summary file at {state_path}")
-        with open(state_path, 'rb') as file:
-            states = pickle.load(file)
-            if not isinstance(states, list):
-                raise ValueError(f"Expected {state_path} to contain a list, but found a {type(states)}")
-            if len(states) != len(in_memory_objects):
-                raise ValueError("Expected {} to contain {} objects, but found {} instead".format(
-                    state_path, len(in_memory_objects), len(states)))
-            for obj, state in zip(in_memory_objects, states):
-                if hasattr(obj, '__setstate__'):
-                    obj.__setstate__(state)
-                elif hasattr(obj, '__dict__'):
-                    obj.__dict__.update(state)
-                else:
-                    # Might be a None or something else that can't be updated
-                    pass
+        try:
+            states = System._load_pickle(state_path)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Could not find summary file at {state_path}") from None
+        System._restore_list(states, in_memory_objects, state_path)
+
+    @staticmethod
+    def _restore_list(states: Any, in_memory_objects: List[Any], source: str) -> None:
+        """Update a list of in-memory objects from their saved states.
+
+        Args:
+            states: The saved states.
+            in_memory_objects: The existing in memory objects to be updated.
+            source: Where the `states` came from (for error messages).
+
+        Raises:
+            ValueError: If the number of saved states does not match the number of in-memory objects.
+        """
+        if not isinstance(states, list):
+            raise ValueError(f"Expected {source} to contain a list, but found a {type(states)}")
+        if len(states) != len(in_memory_objects):
+            raise ValueError("Expected {} to contain {} objects, but found {} instead".format(
+                source, len(in_memory_objects), len(states)))
+        for obj, state in zip(in_memory_objects, states):
+            if hasattr(obj, '__setstate__'):
+                obj.__setstate__(state)
+            elif hasattr(obj, '__dict__'):
+                obj.__dict__.update(state)
+            else:
+                # Might be a None or something else that can't be updated
+                pass
 
     @staticmethod
     def _load_dict(state_path: str, in_memory_objects: Dict[Any, Any]) -> None:
@@ -311,22 +568,36 @@ class System:
             ValueError: If the configuration of saved states does not match the number of in-memory objects.
             FileNotFoundError: If the desired state file cannot be found.
         """
-        if not os.path.exists(state_path):
-            raise FileNotFoundError(f"Could not find summary file at {state_path}")
-        with open(state_path, 'rb') as file:
-            states = pickle.load(file)
-            if not isinstance(states, dict):
-                raise ValueError(f"Expected {state_path} to contain a dict, but found a {type(states)}")
-            # Note that not being a subset is different from being a superset
-            if not states.keys() <= in_memory_objects.keys():
-                raise ValueError("{} contained unexpected keys: {}".format(state_path,
-                                                                           states.keys() - in_memory_objects.keys()))
-            for key, state in states.items():
-                obj = in_memory_objects[key]
-                if hasattr(obj, '__setstate__'):
-                    obj.__setstate__(state)
-                elif hasattr(obj, '__dict__'):
-                    obj.__dict__.update(state)
-                else:
-                    # Might be a None or something else that can't be updated
-                    pass
+        try:
+            states = System._load_pickle(state_path)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Could not find summary file at {state_path}") from None
+        System._restore_dict(states, in_memory_objects, state_path)
+
+    @staticmethod
+    def _restore_dict(states: Any, in_memory_objects: Dict[Any, Any], source: str) -> None:
+        """Update a dictionary of in-memory objects from their saved states.
+
+        Args:
+            states: The saved states.
+            in_memory_objects: The existing in memory objects to be updated.
+            source: Where the `states` came from (for error messages).
+
+        Raises:
+            ValueError: If the configuration of saved states does not match the number of in-memory objects.
+        """
+        if not isinstance(states, dict):
+            raise ValueError(f"Expected {source} to contain a dict, but found a {type(states)}")
+        # Note that not being a subset is different from being a superset
+        if not states.keys() <= in_memory_objects.keys():
+            raise ValueError("{} contained unexpected keys: {}".format(source,
+                                                                       states.keys() - in_memory_objects.keys()))
+        for key, state in states.items():
+            obj = in_memory_objects[key]
+            if hasattr(obj, '__setstate__'):
+                obj.__setstate__(state)
+            elif hasattr(obj, '__dict__'):
+                obj.__dict__.update(state)
+            else:
+                # Might be a None or something else that can't be updated
+                pass
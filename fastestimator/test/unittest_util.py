@@ -203,8 +203,12 @@ def check_img_similar(img1: np.ndarray, img2: np.ndarray, ptol: int = 3, ntol: f
         boolean of whether the images are similar
     """
     if img1.shape == img2.shape:
-        diff = np.abs(img1.astype(np.float32) - img2.astype(np.float32))
-        n_pixel_diff = diff[diff > ptol].size
+        if img1.dtype == np.uint8 and img2.dtype == np.uint8:
+            # Compute the absolute difference without leaving uint8 (and without wrapping around)
+            diff = np.maximum(img1, img2) - np.minimum(img1, img2)
+        else:
+            diff = np.abs(img1.astype(np.float32) - img2.astype(np.float32))
+        n_pixel_diff = np.count_nonzero(diff > ptol)
         if n_pixel_diff < img1.size * ntol:
             return True
         else:
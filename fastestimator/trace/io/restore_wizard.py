@@ -58,13 +58,18 @@ class RestoreWizard(Trace):
 
     def on_epoch_end(self, data: Data) -> None:
         if self.system.epoch_idx % self.frequency == 0:
-            directory = self.dirs[self.dir_idx]
-            self.system.save_state(directory)
-            self._write_key()
-            # Everything after this is free to die without causing problems with restore
-            self.dir_idx = int(not self.dir_idx)
-            self._cleanup(self.dirs[self.dir_idx])
-            print("FastEstimator-RestoreWizard: Saved milestones to {}".format(directory))
+            dir_idx = self.dir_idx
+            directory = self.dirs[dir_idx]
+
+            def _on_saved() -> None:
+                self._write_key(dir_idx)
+                # Everything after this is free to die without causing problems with restore
+                self._cleanup(self.dirs[int(not dir_idx)])
+                print("FastEstimator-RestoreWizard: Saved milestones to {}".format(directory))
+
+            # The files are flushed in the background, so the key is only switched over once they are all on disk
+            self.system.save_state(directory, on_complete=_on_saved)
+            self.dir_idx = int(not dir_idx)
 
     def _load_key(self) -> None:
         """Set the dir_idx based on the key last saved by the restore wizard.
@@ -79,13 +84,16 @@ class RestoreWizard(Trace):
                              " whatever manual changes were made to the file.".format(self.key_path))
         self.dir_idx = 0 if key == 'A' else 1
 
-    def _write_key(self) -> None:
+    def _write_key(self, dir_idx: int) -> None:
         """Generate a new key file and then atomically replace the old key file.
+
+        Args:
+            dir_idx: The index of the directory which the new key should point to.
         """
-        sub_dir = self.dirs[self.dir_idx]
+        sub_dir = self.dirs[dir_idx]
         new_key_path = os.path.join(sub_dir, 'key.txt')
         with open(new_key_path, 'w') as new_key_file:
-            new_key_file.write("B" if self.dir_idx else "A")
+            new_key_file.write("B" if dir_idx else "A")
         os.replace(new_key_path, self.key_path)  # This operation is atomic per POSIX requirements
 
     @staticmethod
@@ -523,10 +523,15 @@ def pad_data(data: np.ndarray, target_shape: Tuple[int, ...], pad_value: Union[f
 
     Returns:
         The `data`, padded to the `target_shape`.
+
+    Raises:
+        ValueError: If the `target_shape` has a different rank than `data`, or is smaller than `data` along any axis.
     """
-    shape_difference = np.array(target_shape) - np.array(data.shape)
-    padded_shape = np.array([np.zeros_like(shape_difference), shape_difference]).T
-    return np.pad(data, padded_shape, 'constant', constant_values=pad_value)
+    if len(target_shape) != data.ndim or any(target < size for target, size in zip(target_shape, data.shape)):
+        raise ValueError("Cannot pad data of shape {} to target shape {}".format(data.shape, target_shape))
+    padded = np.full(target_shape, pad_value, dtype=data.dtype)
+    padded[tuple(slice(0, size) for size in data.shape)] = data
+    return padded
 
 
 def is_number(arg: str) -> bool:
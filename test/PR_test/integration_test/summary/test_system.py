@@ -13,6 +13,7 @@
 # limitations under the License.
 # ==============================================================================
 import os
+import pickle
 import shutil
 import tempfile
 import unittest
@@ -38,13 +39,10 @@ class TestSystem(unittest.TestCase):
         system.global_step = global_step
         system.epoch_idx = epoch_idx
         with self.subTest("Check state files were created"):
-            system.save_state(save_dir=save_path)
-            self.assertTrue(os.path.exists(os.path.join(save_path, 'ds.pkl')))
-            self.assertTrue(os.path.exists(os.path.join(save_path, 'nops.pkl')))
+            system.save_state(save_dir=save_path).result()
+            self.assertTrue(os.path.exists(os.path.join(save_path, 'state_collections.pkl')))
             self.assertTrue(os.path.exists(os.path.join(save_path, 'summary.pkl')))
             self.assertTrue(os.path.exists(os.path.join(save_path, 'system.json')))
-            self.assertTrue(os.path.exists(os.path.join(save_path, 'tops.pkl')))
-            self.assertTrue(os.path.exists(os.path.join(save_path, 'traces.pkl')))
             for model_name in model_names:
                 self.assertTrue(os.path.exists(os.path.join(save_path, f'{model_name}.pt')))
                 self.assertTrue(os.path.exists(os.path.join(save_path, f'{model_name}_opt.pt')))
@@ -68,13 +66,10 @@ class TestSystem(unittest.TestCase):
         system.global_step = global_step
         system.epoch_idx = epoch_idx
         with self.subTest("Check state files were created"):
-            system.save_state(save_dir=save_path)
-            self.assertTrue(os.path.exists(os.path.join(save_path, 'ds.pkl')))
-            self.assertTrue(os.path.exists(os.path.join(save_path, 'nops.pkl')))
+            system.save_state(save_dir=save_path).result()
+            self.assertTrue(os.path.exists(os.path.join(save_path, 'state_collections.pkl')))
             self.assertTrue(os.path.exists(os.path.join(save_path, 'summary.pkl')))
             self.assertTrue(os.path.exists(os.path.join(save_path, 'system.json')))
-            self.assertTrue(os.path.exists(os.path.join(save_path, 'tops.pkl')))
-            self.assertTrue(os.path.exists(os.path.join(save_path, 'traces.pkl')))
             for model_name in model_names:
                 self.assertTrue(os.path.exists(os.path.join(save_path, f'{model_name}.h5')))
                 self.assertTrue(os.path.exists(os.path.join(save_path, f'{model_name}_opt.pkl')))
@@ -87,3 +82,31 @@ class TestSystem(unittest.TestCase):
 
         if os.path.exists(save_path):
             shutil.rmtree(save_path)
+
+    def test_load_legacy_state_layout(self):
+        system = sample_system_object()
+        global_step = 100
+        save_path = tempfile.mkdtemp()
+
+        system.global_step = global_step
+        system.save_state(save_dir=save_path).result()
+        # Rewrite the combined state file into the layout used by older checkpoints
+        collections_path = os.path.join(save_path, 'state_collections.pkl')
+        with open(collections_path, 'rb') as file:
+            collections = pickle.load(file)
+        os.remove(collections_path)
+        for name, states in collections.items():
+            with open(os.path.join(save_path, f'{name}.pkl'), 'wb') as file:
+                pickle.dump(states, file)
+
+        system = sample_system_object()
+        with self.subTest("Check that legacy state loads properly"):
+            system.load_state(save_path)
+            self.assertEqual(system.global_step, global_step)
+        with self.subTest("Check that missing legacy files are reported"):
+            os.remove(os.path.join(save_path, 'tops.pkl'))
+            with self.assertRaises(FileNotFoundError):
+                sample_system_object().load_state(save_path)
+
+        if os.path.exists(save_path):
+            shutil.rmtree(save_path)
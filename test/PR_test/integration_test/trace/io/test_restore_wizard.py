@@ -35,6 +35,7 @@ class TestRestoreWizard(unittest.TestCase):
         restore_wizard.system = sample_system_object()
         restore_wizard.on_begin(Data())
         restore_wizard.on_epoch_end(Data())
+        restore_wizard.system.finalize()
         with self.subTest("Check Saved Files (1)"):
             self.assertTrue(os.path.exists(os.path.join(save_path, 'key.txt')))
             self.assertTrue(os.path.exists(os.path.join(save_path, 'A')))
@@ -43,6 +44,7 @@ class TestRestoreWizard(unittest.TestCase):
                 key = file.readline()
                 self.assertEqual(key, "A")
         restore_wizard.on_epoch_end(Data())
+        restore_wizard.system.finalize()
         with self.subTest("Check Saved Files (2)"):
             self.assertTrue(os.path.exists(os.path.join(save_path, 'key.txt')))
             self.assertTrue(os.path.exists(os.path.join(save_path, 'B')))
@@ -51,6 +53,7 @@ class TestRestoreWizard(unittest.TestCase):
                 key = file.readline()
                 self.assertEqual(key, "B")
         restore_wizard.on_epoch_end(Data())
+        restore_wizard.system.finalize()
         with self.subTest("Check Saved Files (3)"):
             self.assertTrue(os.path.exists(os.path.join(save_path, 'key.txt')))
             self.assertTrue(os.path.exists(os.path.join(save_path, 'A')))
@@ -59,6 +62,7 @@ class TestRestoreWizard(unittest.TestCase):
                 key = file.readline()
                 self.assertEqual(key, "A")
         restore_wizard.on_epoch_end(Data())
+        restore_wizard.system.finalize()
         with self.subTest("Check Saved Files (4)"):
             self.assertTrue(os.path.exists(os.path.join(save_path, 'key.txt')))
             self.assertTrue(os.path.exists(os.path.join(save_path, 'B')))
@@ -78,6 +82,7 @@ class TestRestoreWizard(unittest.TestCase):
         restore_wizard.system.global_step = global_step
         restore_wizard.system.epoch_idx = epoch_idx
         restore_wizard.on_epoch_end(Data())
+        restore_wizard.system.finalize()
 
         restore_wizard = RestoreWizard(directory=save_path)
         restore_wizard.system = sample_system_object()
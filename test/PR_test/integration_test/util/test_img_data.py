@@ -27,9 +27,10 @@ class TestImageData(unittest.TestCase):
     @classmethod
     def setUpClass(cls):
         cls.output_img = os.path.abspath(os.path.join(__file__, "..", "resources", "test_img_data_paintfig.png"))
+        cls.output = img_to_rgb_array(cls.output_img)
         cls.input_image_shape = (150, 150)
         cls.label_shape = (4, )
-        cls.x_test = 0.5 * tf.ones((4, 150, 150, 3))
+        cls.x_test = tf.fill((4, 150, 150, 3), 0.5)
         cls.y_test = tf.ones(cls.label_shape)
         cls.img_data = ImgData(y=cls.y_test, x=cls.x_test)
 
@@ -84,12 +85,10 @@ class TestImageData(unittest.TestCase):
 
     def test_paint_figure(self):
         fig = self.img_data.paint_figure()
-        output = img_to_rgb_array(self.output_img)
         output_test = fig_to_rgb_array(fig)
-        self.assertTrue(check_img_similar(output, output_test))
+        self.assertTrue(check_img_similar(self.output, output_test))
 
     def test_paint_numpy(self):
         output_test = self.img_data.paint_numpy()
         output_test = np.squeeze(output_test, axis=0)
-        output = img_to_rgb_array(self.output_img)
-        self.assertTrue(check_img_similar(output, output_test))
+        self.assertTrue(check_img_similar(self.output, output_test))
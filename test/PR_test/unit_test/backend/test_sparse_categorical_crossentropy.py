@@ -49,3 +49,23 @@ class TestSparseCategoricalCrossEntropy(unittest.TestCase):
                                                average_loss=False).numpy()
         obj2 = np.array([2.3025851, 2.9957323, 2.3025851])
         self.assertTrue(np.allclose(obj1, obj2))
+
+    def test_sparse_categorical_crossentropy_float16_tf(self):
+        obj1 = sparse_categorical_crossentropy(y_pred=tf.cast(self.tf_pred, tf.float16), y_true=self.tf_true)
+        self.assertEqual(obj1.dtype, tf.float32)
+        self.assertTrue(np.allclose(obj1.numpy(), 2.5336342, atol=1e-3))
+
+    def test_sparse_categorical_crossentropy_bfloat16_tf(self):
+        obj1 = sparse_categorical_crossentropy(y_pred=tf.cast(self.tf_pred, tf.bfloat16), y_true=self.tf_true)
+        self.assertEqual(obj1.dtype, tf.float32)
+        self.assertTrue(np.allclose(obj1.numpy(), 2.5336342, atol=1e-2))
+
+    def test_sparse_categorical_crossentropy_float16_torch(self):
+        obj1 = sparse_categorical_crossentropy(y_pred=self.torch_pred.to(torch.float16), y_true=self.torch_true)
+        self.assertEqual(obj1.dtype, torch.float32)
+        self.assertTrue(np.allclose(obj1.numpy(), 2.5336342, atol=1e-3))
+
+    def test_sparse_categorical_crossentropy_bfloat16_torch(self):
+        obj1 = sparse_categorical_crossentropy(y_pred=self.torch_pred.to(torch.bfloat16), y_true=self.torch_true)
+        self.assertEqual(obj1.dtype, torch.float32)
+        self.assertTrue(np.allclose(obj1.numpy(), 2.5336342, atol=1e-2))
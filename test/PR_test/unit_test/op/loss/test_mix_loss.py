@@ -40,3 +40,48 @@ class TestMixUpBatch(unittest.TestCase):
         output = ml.forward(data=[0.1, pred_binary, true_binary], state={})
 
         self.assertTrue(np.allclose(output.detach().numpy(), 1.6889441))
+
+    def test_mixup_sparse_tf(self):
+        true = tf.constant([[1], [0], [2]])
+        pred = tf.constant([[0.1, 0.8, 0.1], [0.9, 0.05, 0.05], [0.1, 0.2, 0.7]])
+
+        ml = MixLoss(CrossEntropy(inputs=("y_pred", "y"), mode="train", outputs="loss"), lam="lambda")
+        output = ml.forward(data=[0.6, pred, true], state={})
+
+        self.assertTrue(np.allclose(output.numpy(), 1.1504894))
+
+    def test_mixup_sparse_torch(self):
+        true = torch.tensor([[1], [0], [2]])
+        pred = torch.tensor([[0.1, 0.8, 0.1], [0.9, 0.05, 0.05], [0.1, 0.2, 0.7]])
+
+        ml = MixLoss(CrossEntropy(inputs=("y_pred", "y"), mode="train", outputs="loss"), lam="lambda")
+        output = ml.forward(data=[0.6, pred, true], state={})
+
+        self.assertTrue(np.allclose(output.detach().numpy(), 1.1504894))
+
+    def test_mixup_sparse_zero_prob_tf(self):
+        true = tf.constant([[1], [0], [2]])
+        pred = tf.constant([[0.0, 0.8, 0.2], [0.9, 0.1, 0.0], [0.1, 0.2, 0.7]])
+
+        ml = MixLoss(CrossEntropy(inputs=("y_pred", "y"), mode="train", outputs="loss"), lam="lambda")
+        output = ml.forward(data=[0.6, pred, true], state={})
+
+        self.assertTrue(np.allclose(output.numpy(), 0.9656502))
+
+    def test_mixup_sparse_zero_prob_torch(self):
+        true = torch.tensor([[1], [0], [2]])
+        pred = torch.tensor([[0.0, 0.8, 0.2], [0.9, 0.1, 0.0], [0.1, 0.2, 0.7]])
+
+        ml = MixLoss(CrossEntropy(inputs=("y_pred", "y"), mode="train", outputs="loss"), lam="lambda")
+        output = ml.forward(data=[0.6, pred, true], state={})
+
+        self.assertTrue(np.allclose(output.detach().numpy(), 0.9656502))
+
+    def test_mixup_sparse_rank3_tf(self):
+        true = tf.constant([[1, 0], [2, 1]])
+        pred = tf.constant([[[0.1, 0.8, 0.1], [0.6, 0.2, 0.2]], [[0.3, 0.3, 0.4], [0.7, 0.2, 0.1]]])
+
+        ml = MixLoss(CrossEntropy(inputs=("y_pred", "y"), mode="train", outputs="loss", form="sparse"), lam="lambda")
+        output = ml.forward(data=[0.6, pred, true], state={})
+
+        self.assertTrue(np.allclose(output.numpy(), 1.0362217))
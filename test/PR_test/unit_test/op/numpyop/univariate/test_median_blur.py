@@ -45,3 +45,11 @@ class TestMedianBlur(unittest.TestCase):
         for img_output in output:
             with self.subTest('Check output mask shape'):
                 self.assertEqual(img_output.shape, self.multi_output_shape)
+
+    def test_uint8_input_large_ksize(self):
+        median_blur = MedianBlur(inputs='x', outputs='x', blur_limit=(7, 7))
+        output = median_blur.forward(data=[np.random.randint(0, 256, size=(28, 28, 3), dtype=np.uint8)], state={})
+        with self.subTest('Check output image shape'):
+            self.assertEqual(output[0].shape, self.single_output_shape)
+        with self.subTest('Check output image dtype'):
+            self.assertEqual(output[0].dtype, np.uint8)
@@ -47,3 +47,19 @@ class TestPadSequence(unittest.TestCase):
         op = PadSequence(inputs='x', outputs='x', max_len=7, value=0, append=False)
         data = op.forward(data=self.single_input, state={})
         self.assertTrue(is_equal(data, [np.array([0, 0, 0, 1, 2, 3, 4])]))
+
+    def test_multi_input_mixed_dtype(self):
+        op = PadSequence(inputs=('x', 'w'), outputs=('x', 'w'), max_len=4, value=0)
+        ids = np.array([3, 1], dtype=np.int32)
+        weights = np.array([0.5, 0.25], dtype=np.float32)
+        data = op.forward(data=[ids, weights], state={})
+        with self.subTest("Check values"):
+            self.assertTrue(is_equal(data, [np.array([3, 1, 0, 0]), np.array([0.5, 0.25, 0.0, 0.0])]))
+        with self.subTest("Check dtypes are kept per key"):
+            self.assertTrue(np.issubdtype(data[0].dtype, np.integer))
+            self.assertTrue(np.issubdtype(data[1].dtype, np.floating))
+
+    def test_list_input(self):
+        op = PadSequence(inputs='x', outputs='x', max_len=5, value=0)
+        data = op.forward(data=[[1, 2, 3]], state={})
+        self.assertTrue(is_equal(data, [np.array([1, 2, 3, 0, 0])]))